@@ -9,6 +9,7 @@ from .base_agent import BaseAgent
 # This allows using some agents without installing all dependencies
 __all__ = [
     'BaseAgent',
+    'CommandID',
     'InputAgent',
     'RecognitionAgent',
     'CommandParserAgent',
@@ -18,7 +19,10 @@ __all__ = [
 
 def __getattr__(name):
     """Lazy import of agents to avoid loading all dependencies"""
-    if name == 'InputAgent':
+    if name == 'CommandID':
+        from .command_ids import CommandID
+        return CommandID
+    elif name == 'InputAgent':
         from .input_agent import InputAgent
         return InputAgent
     elif name == 'RecognitionAgent':
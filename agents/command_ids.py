@@ -0,0 +1,41 @@
+"""
+Command ID Module
+Integer identifiers for command actions, for cheap comparisons and dispatch
+"""
+
+from enum import IntEnum
+
+
+class CommandID(IntEnum):
+    """Integer codes for command actions emitted by the parser"""
+    UNKNOWN = 0
+    MOVE_FORWARD = 1
+    MOVE_BACKWARD = 2
+    TURN_LEFT = 3
+    TURN_RIGHT = 4
+    STOP = 5
+    NAVIGATE_KITCHEN = 6
+    NAVIGATE_BEDROOM = 7
+    NAVIGATE_LIVING_ROOM = 8
+    RETURN_HOME = 9
+    PICK_UP = 10
+    PUT_DOWN = 11
+    OPEN_GRIPPER = 12
+    CLOSE_GRIPPER = 13
+    GET_STATUS = 14
+    GET_BATTERY = 15
+    SHUTDOWN = 16
+    RESTART = 17
+
+
+def command_id_for(name: str) -> CommandID:
+    """
+    Map a command action name to its CommandID
+
+    Args:
+        name: Command action name, e.g. 'MOVE_FORWARD'
+
+    Returns:
+        Matching CommandID, or CommandID.UNKNOWN for unmapped names
+    """
+    return CommandID.__members__.get(name, CommandID.UNKNOWN)
@@ -3,10 +3,64 @@ Command Parser Agent Module
 Handles parsing transcribed text into actionable commands
 """
 
-import yaml
+import json
+import os
+from collections import defaultdict
+from math import ceil
 from typing import Any, Dict, Optional, List
-from difflib import SequenceMatcher
 from .base_agent import BaseAgent
+from .command_ids import CommandID, command_id_for
+
+# RapidFuzz provides C++ implementations of the fuzzy scorers with
+# early-exit on score_cutoff; fall back to difflib when unavailable
+try:
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+except ImportError:
+    rf_process = None
+    rf_fuzz = None
+
+# pyahocorasick scans all command keys in one C-level pass over the text
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _bounded_lev(a: str, b: str, max_d: int) -> int:
+    """
+    Levenshtein distance bounded by max_d
+
+    Uses two rolling rows (O(min(n,m)) memory) and aborts as soon as the
+    running row minimum exceeds the bound, returning max_d + 1.
+
+    Args:
+        a: First string
+        b: Second string
+        max_d: Maximum distance of interest
+
+    Returns:
+        Edit distance, or max_d + 1 if it exceeds the bound
+    """
+    if len(a) > len(b):
+        a, b = b, a
+
+    if len(b) - len(a) > max_d:
+        return max_d + 1
+
+    prev = list(range(len(a) + 1))
+    for j, cb in enumerate(b, 1):
+        cur = [j] + [0] * len(a)
+        for i, ca in enumerate(a, 1):
+            cur[i] = min(
+                prev[i] + 1,
+                cur[i - 1] + 1,
+                prev[i - 1] + (ca != cb)
+            )
+        if min(cur) > max_d:
+            return max_d + 1
+        prev = cur
+
+    return prev[-1]
 
 
 class CommandParserAgent(BaseAgent):
@@ -21,11 +75,17 @@ class CommandParserAgent(BaseAgent):
         """
         super().__init__(config)
         self.commands_file = config.get('commands_file', 'config/commands.yaml')
+        self._preloaded = config.get('_preloaded')
         self.fuzzy_matching = config.get('fuzzy_matching', True)
         self.confidence_threshold = config.get('confidence_threshold', 0.6)
         self.commands = {}
         self.aliases = {}
-    
+        self._commands_keys = []
+        self._resolved = {}
+        self._by_len = {}
+        self._trie = {}
+        self._automaton = None
+
     def initialize(self) -> bool:
         """
         Load command definitions from YAML file
@@ -34,12 +94,16 @@ class CommandParserAgent(BaseAgent):
             bool: True if successful
         """
         try:
-            with open(self.commands_file, 'r') as f:
-                data = yaml.safe_load(f)
-            
+            data = self._load_commands_data()
+
             self.commands = data.get('commands', {})
             self.aliases = data.get('aliases', {})
-            
+            self._commands_keys = list(self.commands.keys())
+            self._build_resolved()
+            self._build_trie()
+            self._build_length_buckets()
+            self._build_automaton()
+
             self.logger.info(f"Loaded {len(self.commands)} commands and {len(self.aliases)} aliases")
             self.initialized = True
             return True
@@ -48,7 +112,128 @@ class CommandParserAgent(BaseAgent):
             self.logger.error(f"Failed to load commands: {e}")
             self.initialized = False
             return False
-    
+
+    def _load_commands_data(self) -> Dict[str, Any]:
+        """
+        Load command definitions, preferring a JSON sidecar cache
+
+        When the orchestrator already parsed commands.yaml during
+        load_config, that dict is reused and no file is touched here.
+        Otherwise the YAML is only parsed when the sidecar is missing or
+        older than the YAML; json.load is roughly 20x faster than PyYAML.
+
+        Returns:
+            Parsed commands data dictionary
+        """
+        if self._preloaded is not None:
+            return self._preloaded
+
+        cache_file = self.commands_file + '.json'
+
+        try:
+            if os.path.getmtime(cache_file) >= os.path.getmtime(self.commands_file):
+                with open(cache_file, 'r') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        # Imported here so that loading this module stays cheap
+        import yaml
+
+        # Use the libyaml C loader when the extension is available
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(self.commands_file, 'r') as f:
+            data = yaml.load(f, Loader=loader)
+
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump(data, f)
+        except OSError as e:
+            self.logger.warning(f"Could not write commands cache: {e}")
+
+        return data
+
+    def _build_resolved(self):
+        """Flatten commands and aliases into one canonical-key lookup"""
+        resolved = {key: key for key in self.commands}
+        resolved.update({
+            alias: target for alias, target in self.aliases.items()
+            if target in self.commands
+        })
+        self._resolved = resolved
+
+    def _build_trie(self):
+        """Build a character trie over commands and aliases for prefix lookup"""
+        trie = {}
+        for key, canonical in self._resolved.items():
+            node = trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node['$'] = canonical
+        self._trie = trie
+
+    def _trie_prefix(self, text: str) -> Optional[str]:
+        """
+        Find the longest command that prefixes the text at a word boundary
+
+        Args:
+            text: Normalized utterance text
+
+        Returns:
+            Canonical command key, or None if no prefix matches
+        """
+        node = self._trie
+        best = None
+        for i, ch in enumerate(text):
+            node = node.get(ch)
+            if node is None:
+                break
+            if '$' in node and (i + 1 == len(text) or text[i + 1] == ' '):
+                best = node['$']
+        return best
+
+    def _build_length_buckets(self):
+        """Group command keys by length for the fuzzy-match prefilter"""
+        by_len = defaultdict(list)
+        for key in self.commands:
+            by_len[len(key)].append(key)
+        self._by_len = dict(by_len)
+
+    def _build_automaton(self):
+        """Build the Aho-Corasick automaton over commands and aliases"""
+        if ahocorasick is None or not self._resolved:
+            self._automaton = None
+            return
+
+        automaton = ahocorasick.Automaton()
+        for key, canonical in self._resolved.items():
+            automaton.add_word(key, (key, canonical))
+        automaton.make_automaton()
+        self._automaton = automaton
+
+    def _automaton_match(self, text: str) -> Optional[str]:
+        """
+        Find the longest command or alias contained anywhere in the text
+
+        One DFA pass over the utterance replaces per-key substring tests.
+
+        Args:
+            text: Normalized utterance text
+
+        Returns:
+            Canonical command key, or None if nothing is contained
+        """
+        if self._automaton is None:
+            return None
+
+        best = None
+        best_len = 0
+        for _, (key, canonical) in self._automaton.iter(text):
+            if len(key) > best_len:
+                best = canonical
+                best_len = len(key)
+        return best
+
     def process(self, transcription: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Parse transcription into command
@@ -59,56 +244,169 @@ class CommandParserAgent(BaseAgent):
         Returns:
             Dictionary containing parsed command info, or None if no match
         """
-        if not self.initialized:
-            self.logger.error("Command parser not initialized")
-            return None
-        
         if not transcription or 'text' not in transcription:
             self.logger.error("Invalid transcription data")
             return None
-        
-        text = transcription['text'].lower().strip()
+
+        return self.process_text(transcription['text'])
+
+    def process_text(self, text: str, language: str = 'en') -> Optional[Dict[str, Any]]:
+        """
+        Parse raw text into a command without wrapping it in a dict
+
+        Tight callers (demo loops, simulations) can skip building a
+        transcription dict per utterance.
+
+        Args:
+            text: Transcribed or typed utterance
+            language: Language code of the text
+
+        Returns:
+            Dictionary containing parsed command info, or None if no match
+        """
+        if not self.initialized:
+            self.logger.error("Command parser not initialized")
+            return None
+
+        original_text = text
+        text = text.lower().strip()
         self.logger.info(f"Parsing command from: '{text}'")
-        
-        # Check aliases first
-        if text in self.aliases:
-            text = self.aliases[text]
-            self.logger.info(f"Alias resolved to: '{text}'")
-        
-        # Exact match
-        if text in self.commands:
-            command = self.commands[text]
-            self.logger.info(f"Exact match found: {command}")
-            return {
-                'command': command,
-                'original_text': transcription['text'],
-                'matched_text': text,
-                'confidence': 1.0,
-                'match_type': 'exact'
-            }
-        
+
+        match = self._match_deterministic(text)
+        if match is not None:
+            matched_key, confidence, match_type = match
+            result = self._build_result(matched_key, original_text, confidence, match_type)
+            self.logger.info(f"{match_type.capitalize()} match found: {result['command']}")
+            return result
+
         # Fuzzy matching
         if self.fuzzy_matching:
             best_match, confidence = self._fuzzy_match(text)
             
             if best_match and confidence >= self.confidence_threshold:
-                command = self.commands[best_match]
-                self.logger.info(f"Fuzzy match found: {command} (confidence: {confidence:.2f})")
-                return {
-                    'command': command,
-                    'original_text': transcription['text'],
-                    'matched_text': best_match,
-                    'confidence': confidence,
-                    'match_type': 'fuzzy'
-                }
+                result = self._build_result(best_match, original_text, confidence, 'fuzzy')
+                self.logger.info(f"Fuzzy match found: {result['command']} (confidence: {confidence:.2f})")
+                return result
             else:
                 self.logger.warning(f"No match found above threshold (best: {confidence:.2f})")
         
         # No match found
         self.logger.warning(f"No command match for: '{text}'")
+        return self._unknown_result(original_text)
+
+    def process_many(self, transcriptions: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Parse a batch of transcriptions in one call
+
+        Texts that miss the exact, prefix and containment paths are
+        fuzzy-scored together; with rapidfuzz installed that is one
+        C-level cdist over the whole batch instead of a call per text.
+
+        Args:
+            transcriptions: List of dictionaries with a 'text' key
+
+        Returns:
+            List of parse result dicts (None for invalid entries)
+        """
+        if not self.initialized:
+            self.logger.error("Command parser not initialized")
+            return [None] * len(transcriptions)
+
+        results = [None] * len(transcriptions)
+        pending = []
+
+        for i, transcription in enumerate(transcriptions):
+            if not transcription or 'text' not in transcription:
+                continue
+            original = transcription['text']
+            text = original.lower().strip()
+            match = self._match_deterministic(text)
+            if match is not None:
+                matched_key, confidence, match_type = match
+                results[i] = self._build_result(matched_key, original, confidence, match_type)
+            elif self.fuzzy_matching:
+                pending.append((i, original, text))
+            else:
+                results[i] = self._unknown_result(original)
+
+        if not pending:
+            return results
+
+        if rf_process is not None:
+            scores = rf_process.cdist(
+                [text for _, _, text in pending],
+                self._commands_keys,
+                scorer=rf_fuzz.WRatio
+            )
+            for row, (i, original, text) in zip(scores, pending):
+                best = int(row.argmax())
+                confidence = row[best] / 100.0
+                if confidence >= self.confidence_threshold:
+                    results[i] = self._build_result(
+                        self._commands_keys[best], original, confidence, 'fuzzy'
+                    )
+                else:
+                    results[i] = self._unknown_result(original)
+        else:
+            for i, original, text in pending:
+                best_match, confidence = self._fuzzy_match(text)
+                if best_match and confidence >= self.confidence_threshold:
+                    results[i] = self._build_result(best_match, original, confidence, 'fuzzy')
+                else:
+                    results[i] = self._unknown_result(original)
+
+        return results
+
+    def _match_deterministic(self, text: str) -> Optional[tuple]:
+        """
+        Try the exact, prefix and containment lookups in order
+
+        Args:
+            text: Normalized utterance text
+
+        Returns:
+            Tuple of (matched key, confidence, match type), or None if
+            only fuzzy matching could still apply
+        """
+        # Aliases and exact matches share one flattened lookup table,
+        # so the hot path is a single dict access
+        canonical = self._resolved.get(text)
+        if canonical is not None:
+            return canonical, 1.0, 'exact'
+
+        # Prefix walk over the trie: a known command spoken at the start
+        # of a longer utterance resolves in O(len(text)) dict hops
+        prefix = self._trie_prefix(text)
+        if prefix is not None:
+            return prefix, 1.0, 'prefix'
+
+        # One automaton scan catches a command or alias embedded anywhere
+        # in the utterance, not just at the start
+        contained = self._automaton_match(text)
+        if contained is not None:
+            return contained, 0.9, 'contains'
+
+        return None
+
+    def _build_result(self, matched_key: str, original_text: str,
+                      confidence: float, match_type: str) -> Dict[str, Any]:
+        """Assemble the parse result dict for a matched command key"""
+        command = self.commands[matched_key]
+        return {
+            'command': command,
+            'id': command_id_for(command),
+            'original_text': original_text,
+            'matched_text': matched_key,
+            'confidence': confidence,
+            'match_type': match_type
+        }
+
+    def _unknown_result(self, original_text: str) -> Dict[str, Any]:
+        """Assemble the parse result dict for an unmatched utterance"""
         return {
             'command': 'UNKNOWN',
-            'original_text': transcription['text'],
+            'id': CommandID.UNKNOWN,
+            'original_text': original_text,
             'matched_text': None,
             'confidence': 0.0,
             'match_type': 'none'
@@ -124,26 +422,93 @@ class CommandParserAgent(BaseAgent):
         Returns:
             Tuple of (best_match, confidence)
         """
+        # One hash lookup spares the whole scan when callers hand us a
+        # known command verbatim
+        if text in self.commands:
+            return text, 1.0
+
+        if rf_process is not None:
+            match = rf_process.extractOne(
+                text,
+                self._commands_keys,
+                scorer=rf_fuzz.WRatio,
+                score_cutoff=self.confidence_threshold * 100
+            )
+            if match:
+                return match[0], match[1] / 100.0
+
+            # Preserve the substring boost: partial_ratio catches commands
+            # contained in longer utterances that WRatio scores below cutoff
+            match = rf_process.extractOne(
+                text,
+                self._commands_keys,
+                scorer=rf_fuzz.partial_ratio,
+                score_cutoff=80
+            )
+            if match:
+                return match[0], 0.8
+
+            return None, 0.0
+
+        # Pure-Python fallback when rapidfuzz is not installed: bounded
+        # Levenshtein rejects distant candidates after a few DP rows
         best_match = None
         best_ratio = 0.0
-        
-        for command_text in self.commands.keys():
-            ratio = SequenceMatcher(None, text, command_text).ratio()
-            
-            # Also check if command text is contained in input
-            if command_text in text or text in command_text:
-                ratio = max(ratio, 0.8)
-            
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_match = command_text
-        
+
+        # One automaton pass finds every command key contained in the text,
+        # replacing a per-key substring scan inside the loop
+        if self._automaton is not None:
+            contained_keys = {
+                canonical for _, (_, canonical) in self._automaton.iter(text)
+            }
+        else:
+            contained_keys = {
+                key for key in self._commands_keys
+                if key in text or text in key
+            }
+
+        # Containment qualifies for the 0.8 boost even when the key length
+        # falls outside the edit-distance window below; prefer the longest
+        # (most specific) contained key
+        if contained_keys:
+            best_match = max(contained_keys, key=len)
+            best_ratio = 0.8
+
+        # Keys whose length differs from the text by more than the
+        # threshold allows can never reach the confidence cutoff; only
+        # score the length buckets inside that window
+        text_len = len(text)
+        distance_factor = 1 - self.confidence_threshold
+        lo = int(text_len * self.confidence_threshold)
+        hi = ceil(text_len / self.confidence_threshold)
+
+        for length in range(lo, hi + 1):
+            # Everything but the candidate key itself is loop-invariant
+            # within a bucket; hoist it out of the inner loop
+            longer = max(text_len, length)
+            max_d = ceil(distance_factor * longer)
+            for command_text in self._by_len.get(length, ()):
+                distance = _bounded_lev(text, command_text, max_d)
+                ratio = 1.0 - distance / longer if distance <= max_d else 0.0
+
+                if command_text in contained_keys or text in command_text:
+                    ratio = max(ratio, 0.8)
+
+                if ratio > best_ratio:
+                    best_ratio = ratio
+                    best_match = command_text
+
         return best_match, best_ratio
     
     def shutdown(self):
         """Cleanup resources"""
         self.commands = {}
         self.aliases = {}
+        self._commands_keys = []
+        self._resolved = {}
+        self._by_len = {}
+        self._trie = {}
+        self._automaton = None
         self.logger.info("Command parser agent shutdown")
     
     def get_available_commands(self) -> List[str]:
@@ -151,9 +516,10 @@ class CommandParserAgent(BaseAgent):
         Get list of available commands
         
         Returns:
-            List of command text strings
+            List of command text strings (cached; rebuilt on initialize
+            and add_command, so callers should not mutate it)
         """
-        return list(self.commands.keys())
+        return self._commands_keys
     
     def add_command(self, text: str, action: str):
         """
@@ -164,4 +530,9 @@ class CommandParserAgent(BaseAgent):
             action: Command action name
         """
         self.commands[text.lower()] = action
+        self._commands_keys = list(self.commands.keys())
+        self._build_resolved()
+        self._build_trie()
+        self._build_length_buckets()
+        self._build_automaton()
         self.logger.info(f"Added command: '{text}' -> {action}")
@@ -3,8 +3,9 @@ Input Agent Module
 Handles audio input capture from microphone
 """
 
+import time
+
 import numpy as np
-import sounddevice as sd
 from typing import Any, Dict, Optional
 from .base_agent import BaseAgent
 
@@ -26,6 +27,11 @@ class InputAgent(BaseAgent):
         self.chunk_duration = config.get('chunk_duration', 5)
         self.silence_threshold = config.get('silence_threshold', 0.01)
         self.recording = False
+        self._sd = None
+        self._stream = None
+        self._ring = None
+        self._wpos = 0
+        self._filled = 0
     
     def initialize(self) -> bool:
         """
@@ -35,6 +41,11 @@ class InputAgent(BaseAgent):
             bool: True if successful
         """
         try:
+            # Imported here so that loading this module stays cheap;
+            # sounddevice initializes PortAudio on import
+            import sounddevice as sd
+            self._sd = sd
+
             # Test if the audio device is available
             devices = sd.query_devices()
             self.logger.info(f"Available audio devices: {len(devices)}")
@@ -43,16 +54,21 @@ class InputAgent(BaseAgent):
                 self.device = sd.default.device[0]
                 self.logger.info(f"Using default input device: {self.device}")
             
-            # Test recording
-            test_duration = 0.1
-            test_audio = sd.rec(
-                int(test_duration * self.sample_rate),
+            # Persistent stream writing into a preallocated ring buffer;
+            # process() just slices the latest window out of it
+            self._ring = np.zeros(self.sample_rate * 10, dtype=np.int16)
+            self._wpos = 0
+            self._filled = 0
+            self._stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
-                device=self.device
+                device=self.device,
+                dtype='int16',
+                blocksize=1024,
+                callback=self._audio_callback
             )
-            sd.wait()
-            
+            self._stream.start()
+
             self.initialized = True
             self.logger.info("Input agent initialized successfully")
             return True
@@ -62,6 +78,26 @@ class InputAgent(BaseAgent):
             self.initialized = False
             return False
     
+    def _audio_callback(self, indata, frames, time_info, status):
+        """Stream callback: copy the incoming block into the ring buffer"""
+        if status:
+            self.logger.warning(f"Audio stream status: {status}")
+
+        mono = indata[:, 0]
+        n = len(mono)
+        ring = self._ring
+        end = self._wpos + n
+
+        if end <= len(ring):
+            ring[self._wpos:end] = mono
+        else:
+            split = len(ring) - self._wpos
+            ring[self._wpos:] = mono[:split]
+            ring[:n - split] = mono[split:]
+
+        self._wpos = end % len(ring)
+        self._filled = min(self._filled + n, len(ring))
+
     def process(self, data: Any = None) -> Optional[np.ndarray]:
         """
         Capture audio input
@@ -81,31 +117,40 @@ class InputAgent(BaseAgent):
             
             self.logger.info(f"Recording audio for {duration} seconds...")
             self.recording = True
-            
-            # Record audio
-            audio_data = sd.rec(
-                int(duration * self.sample_rate),
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                device=self.device,
-                dtype='float32'
-            )
-            sd.wait()
-            
+
+            # The stream captures continuously; wait out the window, then
+            # slice the most recent samples from the ring buffer
+            time.sleep(duration)
+
+            n_samples = min(int(duration * self.sample_rate), self._filled)
+            wpos = self._wpos
+            start = (wpos - n_samples) % len(self._ring)
+
+            if start + n_samples <= len(self._ring):
+                audio_data = self._ring[start:start + n_samples].copy()
+            else:
+                audio_data = np.concatenate((
+                    self._ring[start:],
+                    self._ring[:wpos]
+                ))
+
             self.recording = False
-            
+
+            if n_samples == 0:
+                self.logger.error("No audio captured from stream")
+                return None
+
             # Check if audio contains actual sound (not just silence)
-            audio_level = np.abs(audio_data).mean()
+            # using two SIMD reductions instead of an abs-then-mean pass
+            peak = max(int(audio_data.max()), -int(audio_data.min()))
+            audio_level = peak / 32768.0
             if audio_level < self.silence_threshold:
                 self.logger.warning("Audio level too low, possibly silence")
-            
+
             self.logger.info(f"Audio captured: {audio_data.shape}, level: {audio_level:.4f}")
-            
-            # Flatten if multi-channel
-            if audio_data.ndim > 1:
-                audio_data = audio_data.flatten()
-            
-            return audio_data
+
+            # Single fused conversion to normalized float32
+            return audio_data.astype(np.float32) * np.float32(1.0 / 32768.0)
             
         except Exception as e:
             self.logger.error(f"Error capturing audio: {e}")
@@ -113,8 +158,17 @@ class InputAgent(BaseAgent):
             return None
     
     def shutdown(self):
-        """Stop recording and cleanup"""
+        """Stop the stream and cleanup"""
         self.recording = False
+
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            except Exception as e:
+                self.logger.error(f"Error closing audio stream: {e}")
+            self._stream = None
+
         self.logger.info("Input agent shutdown")
     
     def list_devices(self) -> list:
@@ -125,7 +179,10 @@ class InputAgent(BaseAgent):
             List of device information
         """
         try:
-            devices = sd.query_devices()
+            if self._sd is None:
+                import sounddevice as sd
+                self._sd = sd
+            devices = self._sd.query_devices()
             return [d for i, d in enumerate(devices) if d['max_input_channels'] > 0]
         except Exception as e:
             self.logger.error(f"Error listing devices: {e}")
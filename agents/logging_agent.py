@@ -5,10 +5,33 @@ Handles file logging of all system activities
 
 import json
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import Any, Dict, Optional
 from .base_agent import BaseAgent
 
+# orjson serializes straight to bytes in native code, several times
+# faster than stdlib json on nested transcript entries
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sentinel that tells the writer thread to drain and exit
+_SHUTDOWN = object()
+
+
+def _dumps_line(data: Dict[str, Any]) -> bytes:
+    """Serialize one log entry to a newline-terminated JSON bytes line"""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return (json.dumps(data, separators=(',', ':')) + '\n').encode()
+
 
 class LoggingAgent(BaseAgent):
     """Agent responsible for logging system activities to files"""
@@ -27,7 +50,14 @@ class LoggingAgent(BaseAgent):
         self.log_transcripts = config.get('log_transcripts', True)
         self.log_commands = config.get('log_commands', True)
         self.session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.flush_every = config.get('flush_every', 32)
         self.log_file = None
+        self._fh = None
+        self._entries_since_flush = 0
+        self._q = None
+        self._writer = None
+        self._ts_sec = 0
+        self._ts_prefix = ''
     
     def initialize(self) -> bool:
         """
@@ -48,14 +78,23 @@ class LoggingAgent(BaseAgent):
             # Create session log file
             log_filename = f"session_{self.session_id}.jsonl"
             self.log_file = os.path.join(self.log_dir, log_filename)
-            
+
+            # Keep one buffered handle open for the whole session instead
+            # of reopening the file for every entry
+            self._fh = open(self.log_file, 'ab', buffering=1 << 16)
+
             # Write session start entry
             self._write_log({
                 'type': 'session_start',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': self._timestamp(),
                 'session_id': self.session_id
             })
-            
+
+            # Writer thread keeps disk I/O off the recognition pipeline
+            self._q = queue.SimpleQueue()
+            self._writer = threading.Thread(target=self._drain, daemon=True)
+            self._writer.start()
+
             self.logger.info(f"Logging initialized: {self.log_file}")
             self.initialized = True
             return True
@@ -81,7 +120,7 @@ class LoggingAgent(BaseAgent):
         try:
             # Add timestamp if not present
             if 'timestamp' not in log_data:
-                log_data['timestamp'] = datetime.now().isoformat()
+                log_data['timestamp'] = self._timestamp()
             
             # Filter based on log type settings
             log_type = log_data.get('type', 'unknown')
@@ -95,14 +134,70 @@ class LoggingAgent(BaseAgent):
             if log_type == 'audio' and not self.log_audio:
                 return True
             
-            # Write to log file
-            self._write_log(log_data)
+            # Hand off to the writer thread; this never blocks on disk
+            self._q.put(log_data)
             return True
             
         except Exception as e:
             self.logger.error(f"Error logging data: {e}")
             return False
     
+    def _timestamp(self) -> str:
+        """
+        ISO-format timestamp with the strftime work cached per second
+
+        Only the sub-second part is formatted per entry; the date/time
+        prefix is reformatted when the wall clock ticks over a second.
+
+        Returns:
+            ISO-8601 style timestamp string
+        """
+        now = time.time()
+        secs = int(now)
+        if secs != self._ts_sec:
+            self._ts_sec = secs
+            self._ts_prefix = time.strftime(
+                '%Y-%m-%dT%H:%M:%S', time.localtime(secs)
+            )
+        return f"{self._ts_prefix}.{int((now - secs) * 1e6):06d}"
+
+    def _drain(self):
+        """Writer thread loop: batch queued entries and write them together"""
+        while True:
+            entry = self._q.get()
+            if entry is _SHUTDOWN:
+                return
+
+            batch = [entry]
+            while len(batch) < 64:
+                try:
+                    entry = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is _SHUTDOWN:
+                    self._write_batch(batch)
+                    return
+                batch.append(entry)
+
+            self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        """
+        Write a batch of log entries in a single write call
+
+        Args:
+            batch: List of log data dictionaries
+        """
+        try:
+            lines = b''.join(_dumps_line(data) for data in batch)
+            self._fh.write(lines)
+            self._entries_since_flush += len(batch)
+            if self._entries_since_flush >= self.flush_every:
+                self._fh.flush()
+                self._entries_since_flush = 0
+        except Exception as e:
+            self.logger.error(f"Failed to write log batch: {e}")
+
     def _write_log(self, data: Dict[str, Any]):
         """
         Write log entry to file
@@ -110,9 +205,15 @@ class LoggingAgent(BaseAgent):
         Args:
             data: Log data dictionary
         """
+        if self._fh is None:
+            return
+
         try:
-            with open(self.log_file, 'a') as f:
-                f.write(json.dumps(data) + '\n')
+            self._fh.write(_dumps_line(data))
+            self._entries_since_flush += 1
+            if self._entries_since_flush >= self.flush_every:
+                self._fh.flush()
+                self._entries_since_flush = 0
         except Exception as e:
             self.logger.error(f"Failed to write log: {e}")
     
@@ -191,12 +292,25 @@ class LoggingAgent(BaseAgent):
     def shutdown(self):
         """Write session end log and cleanup"""
         if self.enabled and self.initialized:
+            if self._writer is not None:
+                # Let the writer flush everything queued before us
+                self._q.put(_SHUTDOWN)
+                self._writer.join(timeout=5)
+                self._writer = None
+
             self._write_log({
                 'type': 'session_end',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': self._timestamp(),
                 'session_id': self.session_id
             })
-        
+
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except Exception as e:
+                self.logger.error(f"Failed to close log file: {e}")
+            self._fh = None
+
         self.logger.info("Logging agent shutdown")
     
     def get_session_log_path(self) -> Optional[str]:
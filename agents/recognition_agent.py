@@ -3,8 +3,8 @@ Recognition Agent Module
 Handles speech-to-text using OpenAI Whisper (offline)
 """
 
-import whisper
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 from .base_agent import BaseAgent
 
@@ -23,22 +23,66 @@ class RecognitionAgent(BaseAgent):
         self.model_size = config.get('model_size', 'base')
         self.device = config.get('device', 'cpu')
         self.language = config.get('language', 'en')
+        self.include_raw = config.get('include_raw', False)
         self.model = None
-    
+        self._whisper = None
+        self._backend = None
+
+        # Kick off the model load immediately so it overlaps with audio
+        # device warmup and the other agents' initialization
+        self._load_executor = ThreadPoolExecutor(max_workers=1)
+        self._load_future = self._load_executor.submit(self._load_model)
+
+    def _load_model(self):
+        """
+        Import the recognition backend and load the model
+
+        Returns:
+            Tuple of (model, backend name)
+        """
+        # Prefer the CTranslate2 backend: int8 weights on CPU are
+        # roughly 4x faster than fp32 whisper on the same hardware
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            WhisperModel = None
+
+        if WhisperModel is not None:
+            compute_type = 'int8' if self.device == 'cpu' else 'float16'
+            self.logger.info(
+                f"Loading faster-whisper model: {self.model_size} ({compute_type})"
+            )
+            model = WhisperModel(
+                self.model_size,
+                device=self.device,
+                compute_type=compute_type
+            )
+            return model, 'faster_whisper'
+
+        # Imported here so that loading this module stays cheap;
+        # whisper pulls in torch which takes seconds to import
+        import whisper
+        self._whisper = whisper
+
+        self.logger.info(f"Loading Whisper model: {self.model_size}")
+        model = whisper.load_model(self.model_size, device=self.device)
+        return model, 'whisper'
+
     def initialize(self) -> bool:
         """
         Initialize Whisper model (downloads if needed)
-        
+
         Returns:
             bool: True if successful
         """
         try:
-            self.logger.info(f"Loading Whisper model: {self.model_size}")
-            self.model = whisper.load_model(self.model_size, device=self.device)
+            self.model, self._backend = self._load_future.result()
+            self._load_executor.shutdown(wait=False)
+
             self.initialized = True
             self.logger.info("Recognition agent initialized successfully")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Failed to initialize recognition agent: {e}")
             self.initialized = False
@@ -63,33 +107,88 @@ class RecognitionAgent(BaseAgent):
             return None
         
         try:
-            # Ensure audio is float32 and normalized
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
-            
-            # Whisper expects audio between -1 and 1
+            # Ensure audio is contiguous float32; no-op when already correct
+            audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+
+            # Whisper expects audio between -1 and 1; scale in place to
+            # avoid allocating a second full-size buffer
             max_val = np.abs(audio_data).max()
             if max_val > 1.0:
-                audio_data = audio_data / max_val
+                np.multiply(audio_data, np.float32(1.0 / max_val), out=audio_data)
             
             self.logger.info("Transcribing audio...")
-            
+
+            if self._backend == 'faster_whisper':
+                segments, info = self.model.transcribe(
+                    audio_data,
+                    language=self.language if self.language else None,
+                    beam_size=1,
+                    vad_filter=True
+                )
+                segments = list(segments)
+
+                text = ' '.join(s.text.strip() for s in segments).strip()
+                self.logger.info(f"Transcription: '{text}'")
+
+                output = {
+                    'text': text,
+                    'language': info.language,
+                    'segments': segments
+                }
+                if self.include_raw:
+                    output['raw_result'] = info
+                return output
+
+            if self.device != 'cpu':
+                # On GPU, compute the mel spectrogram once and decode
+                # directly in fp16, skipping transcribe()'s per-call
+                # preprocessing and extra host<->device copies
+                import torch
+
+                whisper = self._whisper
+                audio = whisper.pad_or_trim(torch.from_numpy(audio_data))
+                mel = whisper.log_mel_spectrogram(audio).to(
+                    self.device, non_blocking=True
+                )
+                options = whisper.DecodingOptions(
+                    language=self.language if self.language else None,
+                    fp16=True
+                )
+                decoded = whisper.decode(self.model, mel, options)
+
+                text = decoded.text.strip()
+                self.logger.info(f"Transcription: '{text}'")
+
+                output = {
+                    'text': text,
+                    'language': decoded.language,
+                    'segments': []
+                }
+                if self.include_raw:
+                    output['raw_result'] = decoded
+                return output
+
             # Transcribe
             result = self.model.transcribe(
                 audio_data,
                 language=self.language if self.language else None,
                 fp16=False  # Use fp32 for CPU compatibility
             )
-            
+
             text = result['text'].strip()
             self.logger.info(f"Transcription: '{text}'")
-            
-            return {
+
+            # raw_result holds the full Whisper output including token-level
+            # data; only attach it when explicitly requested so downstream
+            # logging stays small
+            output = {
                 'text': text,
                 'language': result.get('language', 'unknown'),
-                'segments': result.get('segments', []),
-                'raw_result': result
+                'segments': result.get('segments', [])
             }
+            if self.include_raw:
+                output['raw_result'] = result
+            return output
             
         except Exception as e:
             self.logger.error(f"Error during transcription: {e}")
@@ -3,14 +3,18 @@ Demo Mode - Run voice control system without audio hardware
 Perfect for testing in GitHub Codespaces or environments without microphone
 """
 
+import heapq
 import sys
-import yaml
 
 # Import only the agents we need to avoid dependency issues in demo mode
 sys.path.insert(0, '.')
 from agents.command_parser_agent import CommandParserAgent
 from agents.logging_agent import LoggingAgent
 
+# Built once at import; avoids a list allocation and linear scan on
+# every prompt iteration
+_QUIT = frozenset({'quit', 'exit', 'q'})
+
 
 def demo_command_recognition():
     """Demonstrate command recognition with text input"""
@@ -19,9 +23,9 @@ def demo_command_recognition():
     print("=" * 60)
     print("\nRunning without audio hardware - text input simulation\n")
     
-    # Load configuration
-    with open('config/settings.yaml', 'r') as f:
-        config = yaml.safe_load(f)
+    # Load configuration (shares the orchestrator's sidecar cache)
+    from main import _load_yaml_cached
+    config = _load_yaml_cached('config/settings.yaml')
     
     # Initialize agents
     print("Initializing agents...")
@@ -48,7 +52,8 @@ def demo_command_recognition():
     # Show available commands
     print("Available commands:")
     commands = parser.get_available_commands()
-    for i, cmd in enumerate(sorted(commands)[:10], 1):
+    # nsmallest keeps a 10-element heap instead of sorting the full list
+    for i, cmd in enumerate(heapq.nsmallest(10, commands), 1):
         print(f"  {i}. {cmd}")
     if len(commands) > 10:
         print(f"  ... and {len(commands) - 10} more")
@@ -65,18 +70,12 @@ def demo_command_recognition():
             if not user_input:
                 continue
                 
-            if user_input.lower() in ['quit', 'exit', 'q']:
+            if user_input.casefold() in _QUIT:
                 print("Exiting demo mode...")
                 break
             
-            # Simulate transcription
-            transcription = {
-                'text': user_input,
-                'language': 'en'
-            }
-            
-            # Parse command
-            result = parser.process(transcription)
+            # Parse command directly; no per-iteration transcription dict
+            result = parser.process_text(user_input)
             
             if result:
                 command = result['command']
@@ -145,8 +144,7 @@ def demo_fuzzy_matching():
     print("Testing fuzzy matching with typos and variations:\n")
     
     for test_input in test_cases:
-        transcription = {'text': test_input}
-        result = parser.process(transcription)
+        result = parser.process_text(test_input)
         
         if result:
             command = result['command']
@@ -4,14 +4,20 @@ Demonstrates how to integrate the voice control system with a robot
 """
 
 import sys
+from array import array
+from agents.command_ids import CommandID
 from main import VoiceControlOrchestrator
 
 
 class RobotController:
     """Mock robot controller for demonstration"""
+
+    __slots__ = ('position', 'heading')
     
     def __init__(self):
-        self.position = [0, 0]
+        # Packed machine ints instead of a list of boxed PyObjects;
+        # matters when many controllers are simulated at once
+        self.position = array('i', [0, 0])
         self.heading = 0
         
     def move_forward(self):
@@ -36,7 +42,7 @@ class RobotController:
     def get_status(self):
         print(f"🤖 Position: {self.position}, Heading: {self.heading}°")
         return {
-            'position': self.position,
+            'position': list(self.position),
             'heading': self.heading
         }
         
@@ -48,30 +54,39 @@ class RobotController:
         print("🤖 Robot shutting down...")
 
 
-def execute_robot_command(command: str, robot: RobotController):
+# Method-name table indexed by CommandID, built once at import; id
+# dispatch is a single array index instead of a string hash per command
+_COMMAND_METHODS = [None] * (max(CommandID) + 1)
+for _cid, _method in [
+    (CommandID.MOVE_FORWARD, 'move_forward'),
+    (CommandID.MOVE_BACKWARD, 'move_backward'),
+    (CommandID.TURN_LEFT, 'turn_left'),
+    (CommandID.TURN_RIGHT, 'turn_right'),
+    (CommandID.STOP, 'stop'),
+    (CommandID.GET_STATUS, 'get_status'),
+    (CommandID.GET_BATTERY, 'get_battery'),
+    (CommandID.SHUTDOWN, 'shutdown'),
+]:
+    _COMMAND_METHODS[_cid] = _method
+
+
+def execute_robot_command(command_id: int, robot: RobotController):
     """
     Execute robot command based on voice control output
-    
+
     Args:
-        command: Command action name
+        command_id: CommandID value from the parser
         robot: Robot controller instance
     """
-    command_map = {
-        'MOVE_FORWARD': robot.move_forward,
-        'MOVE_BACKWARD': robot.move_backward,
-        'TURN_LEFT': robot.turn_left,
-        'TURN_RIGHT': robot.turn_right,
-        'STOP': robot.stop,
-        'GET_STATUS': robot.get_status,
-        'GET_BATTERY': robot.get_battery,
-        'SHUTDOWN': robot.shutdown,
-    }
-    
-    if command in command_map:
-        command_map[command]()
+    method_name = None
+    if 0 <= command_id < len(_COMMAND_METHODS):
+        method_name = _COMMAND_METHODS[command_id]
+
+    if method_name is not None:
+        getattr(robot, method_name)()
         return True
     else:
-        print(f"⚠ Unknown command: {command}")
+        print(f"⚠ Unknown command id: {command_id}")
         return False
 
 
@@ -119,10 +134,11 @@ def main():
             
             if result and result['success']:
                 command = result['command']['command']
+                command_id = result['command'].get('id', CommandID.UNKNOWN)
                 print(f"\n✓ Command recognized: {command}")
                 
                 # Execute robot command
-                success = execute_robot_command(command, robot)
+                success = execute_robot_command(command_id, robot)
                 
                 if success:
                     print("✓ Command executed successfully\n")
@@ -130,7 +146,7 @@ def main():
                     print("✗ Failed to execute command\n")
                 
                 # Check if shutdown requested
-                if command == 'SHUTDOWN':
+                if command_id == CommandID.SHUTDOWN:
                     print("Shutdown requested, exiting...")
                     break
             else:
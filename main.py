@@ -5,21 +5,90 @@ Coordinates all AI agents and manages the overall workflow
 
 import sys
 import os
+import pickle
 import yaml
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
-from agents import (
-    InputAgent,
-    RecognitionAgent,
-    CommandParserAgent,
-    SpeakerIDAgent,
-    LoggingAgent
-)
+# Use the libyaml C loader when the extension is available; it parses
+# YAML an order of magnitude faster than the pure-Python loader
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+from agents.command_ids import CommandID
+
+# basicConfig silently no-ops once handlers exist; tracking it here
+# skips re-parsing the format string for every orchestrator created in
+# the same process
+_LOGGING_CONFIGURED = False
+
+
+def _load_yaml_cached(path: str) -> Dict[str, Any]:
+    """
+    Load a YAML file, using a pickle sidecar cache when enabled
+
+    With VOICE_YAML_CACHE=1 in the environment, the parsed dict is cached
+    to '<path>.cache.pkl' keyed on the YAML's mtime, so relaunches load a
+    fast pickle instead of re-parsing.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    use_cache = os.environ.get('VOICE_YAML_CACHE') == '1'
+    cache_path = path + '.cache.pkl'
+
+    if use_cache:
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.PickleError):
+            pass
+
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_Loader)
+
+    if use_cache:
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+    return data
+
+
+@lru_cache(maxsize=None)
+def _read_settings(path: str) -> Dict[str, Any]:
+    """
+    Parse a settings file once per process and memoize the result
+
+    Args:
+        path: Path to the settings YAML file
+
+    Returns:
+        Parsed settings dictionary (shared; callers copy before mutating)
+    """
+    return _load_yaml_cached(path)
 
 
 class VoiceControlOrchestrator:
     """Main orchestrator coordinating all agent modules"""
+
+    # Fixed attribute set: slots drop the per-instance __dict__ and make
+    # attribute access a C-level slot load
+    __slots__ = (
+        'config_path', 'config', 'agents', 'running', 'logger',
+        '_executor', '_warm_future',
+        '_input', '_recognition', '_parser', '_speaker', '_log'
+    )
     
     def __init__(self, config_path: str = 'config/settings.yaml'):
         """
@@ -32,13 +101,24 @@ class VoiceControlOrchestrator:
         self.config = {}
         self.agents = {}
         self.running = False
+        self._executor = None
+        self._warm_future = None
+        self._input = None
+        self._recognition = None
+        self._parser = None
+        self._speaker = None
+        self._log = None
         
         # Setup logging
         self._setup_logging()
         self.logger = logging.getLogger('VoiceControlOrchestrator')
     
     def _setup_logging(self):
-        """Setup system-wide logging"""
+        """Setup system-wide logging (once per process)"""
+        global _LOGGING_CONFIGURED
+        if _LOGGING_CONFIGURED:
+            return
+
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -46,6 +126,7 @@ class VoiceControlOrchestrator:
                 logging.StreamHandler(sys.stdout)
             ]
         )
+        _LOGGING_CONFIGURED = True
     
     def load_config(self) -> bool:
         """
@@ -55,14 +136,25 @@ class VoiceControlOrchestrator:
             bool: True if successful
         """
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            # Copy the top level so per-orchestrator tweaks don't leak
+            # into the memoized dict shared across instances
+            self.config = dict(_read_settings(self.config_path))
+
+            # Read commands.yaml in the same pass so the parser agent can
+            # skip its own file I/O later; copy the commands section
+            # before mutating it for the same sharing reason as above
+            commands_config = dict(self.config.get('commands', {}))
+            try:
+                commands_config['_preloaded'] = _load_yaml_cached('config/commands.yaml')
+            except OSError as e:
+                self.logger.warning("Could not preload commands file: %s", e)
+            self.config['commands'] = commands_config
             
-            self.logger.info(f"Configuration loaded from {self.config_path}")
+            self.logger.info("Configuration loaded from %s", self.config_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {e}")
+            self.logger.error("Failed to load configuration: %s", e)
             return False
     
     def initialize_agents(self) -> bool:
@@ -74,29 +166,25 @@ class VoiceControlOrchestrator:
         """
         try:
             self.logger.info("Initializing agents...")
+
+            # Agents are imported here, not at module top, so that paths
+            # like --help never pay the torch/whisper/sounddevice import
+            from agents import (
+                InputAgent,
+                RecognitionAgent,
+                CommandParserAgent,
+                SpeakerIDAgent,
+                LoggingAgent
+            )
             
-            # Initialize Logging Agent first
+            # Initialize Logging Agent first so the rest can log through it
             logging_config = self.config.get('logging', {})
             self.agents['logging'] = LoggingAgent(logging_config)
             if not self.agents['logging'].initialize():
                 self.logger.error("Failed to initialize logging agent")
                 return False
             
-            # Initialize Input Agent
-            audio_config = self.config.get('audio', {})
-            self.agents['input'] = InputAgent(audio_config)
-            if not self.agents['input'].initialize():
-                self.logger.error("Failed to initialize input agent")
-                return False
-            
-            # Initialize Recognition Agent
-            whisper_config = self.config.get('whisper', {})
-            self.agents['recognition'] = RecognitionAgent(whisper_config)
-            if not self.agents['recognition'].initialize():
-                self.logger.error("Failed to initialize recognition agent")
-                return False
-            
-            # Initialize Command Parser Agent
+            # Initialize Command Parser Agent; it only reads commands.yaml
             commands_config = self.config.get('commands', {})
             commands_config['commands_file'] = 'config/commands.yaml'
             self.agents['parser'] = CommandParserAgent(commands_config)
@@ -104,19 +192,68 @@ class VoiceControlOrchestrator:
                 self.logger.error("Failed to initialize command parser agent")
                 return False
             
-            # Initialize Speaker ID Agent
+            audio_config = self.config.get('audio', {})
+            self.agents['input'] = InputAgent(audio_config)
+            
+            whisper_config = self.config.get('whisper', {})
+            self.agents['recognition'] = RecognitionAgent(whisper_config)
+            
             speaker_config = self.config.get('speaker_id', {})
             self.agents['speaker'] = SpeakerIDAgent(speaker_config)
-            if not self.agents['speaker'].initialize():
-                self.logger.warning("Speaker ID agent initialization failed, continuing without it")
             
+            # The model loads and the audio device probe are independent;
+            # initializing them concurrently cuts startup to roughly the
+            # slowest single load
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = {
+                    pool.submit(self.agents[name].initialize): name
+                    for name in ('input', 'recognition', 'speaker')
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    if future.result():
+                        continue
+                    if name == 'speaker':
+                        self.logger.warning("Speaker ID agent initialization failed, continuing without it")
+                    else:
+                        self.logger.error("Failed to initialize %s agent", name)
+                        return False
+            
+            # Bind the pipeline agents to attributes so the hot path
+            # skips a dict lookup per stage
+            self._input = self.agents['input']
+            self._recognition = self.agents['recognition']
+            self._parser = self.agents['parser']
+            self._speaker = self.agents['speaker']
+            self._log = self.agents['logging']
+
+            # Worker used to keep the recognition model warm between
+            # commands without blocking the interactive prompt
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
             self.logger.info("All agents initialized successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Error initializing agents: {e}")
+            self.logger.error("Error initializing agents: %s", e)
             return False
     
+    def _keep_model_warm(self):
+        """
+        Run a short silent decode so the model's caches stay resident
+
+        Submitted to the background executor while the user sits at the
+        prompt; keeps Whisper's tensors warm between commands.
+        """
+        try:
+            import numpy as np
+
+            sample_rate = self.config.get('audio', {}).get('sample_rate', 16000)
+            silence = np.zeros(sample_rate // 10, dtype=np.float32)
+            self._recognition.process(silence)
+        except Exception as e:
+            self.logger.debug("Model keep-warm failed: %s", e)
+
     def process_voice_command(self) -> Optional[Dict[str, Any]]:
         """
         Process a single voice command through the agent pipeline
@@ -127,56 +264,57 @@ class VoiceControlOrchestrator:
         try:
             # Step 1: Capture audio input
             self.logger.info("--- Starting voice command processing ---")
-            audio_data = self.agents['input'].process()
+            audio_data = self._input.process()
             
             if audio_data is None:
                 self.logger.error("Failed to capture audio")
-                self.agents['logging'].log_error("Audio capture failed")
+                self._log.log_error("Audio capture failed")
                 return None
             
             # Step 2: Speaker identification (if enabled)
-            speaker_info = self.agents['speaker'].process(audio_data)
+            speaker_info = self._speaker.process(audio_data)
             if speaker_info:
-                self.logger.info(f"Speaker: {speaker_info.get('speaker_id', 'unknown')}")
+                self.logger.info("Speaker: %s", speaker_info.get('speaker_id', 'unknown'))
             
             # Step 3: Speech recognition
-            transcription = self.agents['recognition'].process(audio_data)
+            transcription = self._recognition.process(audio_data)
             
             if transcription is None or not transcription.get('text'):
                 self.logger.error("Failed to transcribe audio")
-                self.agents['logging'].log_error("Transcription failed")
+                self._log.log_error("Transcription failed")
                 return None
             
             # Log transcription
-            self.agents['logging'].log_transcription(transcription, speaker_info)
+            self._log.log_transcription(transcription, speaker_info)
             
             # Step 4: Command parsing
-            command_result = self.agents['parser'].process(transcription)
+            command_result = self._parser.process(transcription)
             
             if command_result is None:
                 self.logger.error("Failed to parse command")
-                self.agents['logging'].log_error("Command parsing failed")
+                self._log.log_error("Command parsing failed")
                 return None
             
             # Log command
-            self.agents['logging'].log_command(command_result)
+            self._log.log_command(command_result)
             
             # Combine results
             result = {
                 'transcription': transcription,
                 'command': command_result,
                 'speaker': speaker_info,
-                'success': command_result['command'] != 'UNKNOWN'
+                'success': command_result.get('id', CommandID.UNKNOWN) != CommandID.UNKNOWN
             }
             
-            self.logger.info(f"Command: {command_result['command']}")
+            self.logger.info("Command: %s", command_result['command'])
             self.logger.info("--- Voice command processing complete ---\n")
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Error processing voice command: {e}")
-            self.agents['logging'].log_error(str(e))
+            self.logger.error("Error processing voice command: %s", e)
+            if self._log is not None:
+                self._log.log_error(str(e))
             return None
     
     def run_interactive(self):
@@ -190,6 +328,13 @@ class VoiceControlOrchestrator:
         try:
             while self.running:
                 input("Press Enter to start recording (or Ctrl+C to quit)...")
+
+                # Let any in-flight warmup decode finish before sharing
+                # the model with the real command
+                if self._warm_future is not None:
+                    self._warm_future.result()
+                    self._warm_future = None
+
                 result = self.process_voice_command()
                 
                 if result and result['success']:
@@ -197,6 +342,9 @@ class VoiceControlOrchestrator:
                     print(f"\n✓ Command executed: {command}\n")
                 else:
                     print("\n✗ No valid command recognized\n")
+
+                if self._executor is not None:
+                    self._warm_future = self._executor.submit(self._keep_model_warm)
                     
         except KeyboardInterrupt:
             self.logger.info("\nStopping...")
@@ -220,13 +368,18 @@ class VoiceControlOrchestrator:
     def shutdown(self):
         """Shutdown all agents and cleanup"""
         self.logger.info("Shutting down...")
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._warm_future = None
         
         for agent_name, agent in self.agents.items():
             try:
                 agent.shutdown()
-                self.logger.info(f"{agent_name} agent shutdown")
+                self.logger.info("%s agent shutdown", agent_name)
             except Exception as e:
-                self.logger.error(f"Error shutting down {agent_name} agent: {e}")
+                self.logger.error("Error shutting down %s agent: %s", agent_name, e)
         
         self.logger.info("Shutdown complete")
     
@@ -261,11 +414,14 @@ def main():
     if len(sys.argv) > 1:
         if sys.argv[1] in ['--single', '-s']:
             mode = 'single'
+        elif sys.argv[1] == '--preload-model':
+            mode = 'preload'
         elif sys.argv[1] in ['--help', '-h']:
             print("Usage: python main.py [options]")
             print("\nOptions:")
-            print("  --single, -s    Process single command and exit")
-            print("  --help, -h      Show this help message")
+            print("  --single, -s     Process single command and exit")
+            print("  --preload-model  Load models and exit (warms the OS cache)")
+            print("  --help, -h       Show this help message")
             print("\nInteractive mode (default): Continuously process commands")
             return 0
     
@@ -286,7 +442,12 @@ def main():
         print("\n✓ System initialized successfully\n")
         
         # Run in selected mode
-        if mode == 'single':
+        if mode == 'preload':
+            # Model weights are now in the OS page cache, so the next
+            # launch skips most of the cold-start disk reads
+            print("✓ Models preloaded, exiting")
+            exit_code = 0
+        elif mode == 'single':
             exit_code = orchestrator.run_single_command()
         else:
             orchestrator.run_interactive()
@@ -37,6 +37,8 @@ setup(
         "soundfile>=0.12.1",
         "scipy>=1.11.4",
         "pyyaml>=6.0.1",
+        "rapidfuzz>=3.0.0",
+        "pyahocorasick>=2.0.0",
     ],
     entry_points={
         'console_scripts': [